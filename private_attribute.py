@@ -20,11 +20,10 @@ class MyClass(PrivateAttrBase):
 from __future__ import annotations
 import random
 import hashlib
-import inspect
+import sys
 from typing import Any, Callable
 from types import FrameType, CodeType
 import collections
-import string
 import threading
 import time
 import functools
@@ -32,38 +31,60 @@ import warnings
 
 _running_time = time.time()
 
-
-def _generate_private_attr_cache(mod, _cache={}, _lock=threading.Lock()):  #type: ignore
+_INVALID_PRIVATE_ATTR_NAMES = frozenset({
+    "__private_attrs__",
+    "__name__",
+    "__module__",
+    "__class__",
+    "__dict__",
+    "__slots__",
+    "__weakref__",
+    "__getattribute__",
+    "__getattr__",
+    "__setattr__",
+    "__delattr__",
+    "__del__",
+    "__mro__"
+})
+
+_INVALID_CLASS_ATTR_NAMES = frozenset({
+    "__class__",
+    "__delattr__",
+    "__getattribute__",
+    "__getattr__",
+    "__setattr__",
+    "__getstate__",
+    "__setstate__",
+    "__del__",
+    "__private_attrs__"
+})
+
+
+def _generate_private_attr_cache(mod, _cache={}, _values=set(), _index={}, _lock=threading.RLock()):  #type: ignore
     def decorator_generate(func: Callable[[int, str], str]) -> Callable[[int, str], str]:
         def wrapper(obj_id: int, attr_name: str) -> str:
+            key = (obj_id, attr_name)
+            result = _cache.get(key)
+            if result is not None:
+                return result
             with _lock:
-                combined = f"{obj_id}_{attr_name}".encode('utf-8')
-                attr_byte = f"{_running_time}_{attr_name}".encode("utf-8")
-                hash_obj = hashlib.sha256(combined)
-                attr_hash_obj = hashlib.sha256(attr_byte)
-                key = (obj_id, hash_obj.hexdigest(), attr_hash_obj.hexdigest())
                 if key not in _cache:
                     original_result = result = func(obj_id, attr_name)
                     i = 0
-                    while result in _cache.values():
+                    while result in _values:
                         i += 1
                         result = original_result + f"_{i}"
                     _cache[key] = result
-                _original_cache = _cache.copy()
-                _cache.clear()
-                keys = sorted(_original_cache.keys(), key=lambda x: x[1:])
-                for i in keys:
-                    _cache[i] = _original_cache[i]
+                    _values.add(result)
+                    _index.setdefault(obj_id, []).append(attr_name)
                 return _cache[key]
 
         return wrapper
 
     def clear_function(obj_id):
         with _lock:
-            original_key = list(_cache.keys())
-            for i in original_key:
-                if i[0] == obj_id:
-                    del _cache[i]
+            for attr_name in _index.pop(obj_id, ()):
+                _values.discard(_cache.pop((obj_id, attr_name)))
 
     if mod == "generate":
         return decorator_generate
@@ -73,21 +94,8 @@ def _generate_private_attr_cache(mod, _cache={}, _lock=threading.Lock()):  #type
 
 @_generate_private_attr_cache("generate")
 def _generate_private_attr_name(obj_id: int, attr_name: str) -> str:
-    combined = f"{obj_id}_{attr_name}".encode('utf-8')
-    hash_obj = hashlib.sha256(combined)
-
-    seed = int(hash_obj.hexdigest(), 16)
-    random_proxy = random.Random(seed)
-
-    def generate_random_ascii(length):
-        chars = string.printable
-        return ''.join(random_proxy.choice(chars) for _ in range(length))
-
-    part1 = generate_random_ascii(6)
-    part2 = generate_random_ascii(8)
-    part3 = generate_random_ascii(4)
-
-    return f"_{part1}_{part2}_{part3}"
+    digest = "%018x" % (hash((obj_id, attr_name, _running_time)) & 0xFFFFFFFFFFFFFFFF)
+    return f"_{digest[:6]}_{digest[6:14]}_{digest[14:]}"
 
 
 _clear_obj = _generate_private_attr_cache("clean")
@@ -112,7 +120,7 @@ register_to_type, unregister_to_type = _register_local_code()
 
 def _get_all_possible_code(obj):
     if not hasattr(obj, "__get__") and not hasattr(obj, "__call__"):
-        return []
+        return
     if isinstance(obj, property):
         if obj.fget is not None and hasattr(obj.fget, "__code__"):
             yield from _get_code_from_code(obj.fget.__code__)
@@ -132,20 +140,15 @@ def _get_all_possible_code(obj):
     if isinstance(obj, (functools.partial, functools.partialmethod)):
         if hasattr(obj.func, "__code__"):
             yield from _get_code_from_code(obj.func.__code__)
-    return []
 
-def _get_code_from_code(code: CodeType, _seen=None):
+def _get_code_from_code(code: CodeType):
     if not isinstance(code, CodeType):
-        return []
-    if _seen is None:
-        _seen = set()
-    if id(code) in _seen:
-        return []
-    _seen.add(id(code))
-    yield code
-    for const in code.co_consts:
-        if isinstance(const, CodeType):
-            yield from _get_code_from_code(const, _seen)
+        return
+    stack = [code]
+    while stack:
+        code = stack.pop()
+        yield code
+        stack.extend(const for const in code.co_consts if isinstance(const, CodeType))
 
 
 def _resortkey(x: dict):
@@ -155,16 +158,27 @@ def _resortkey(x: dict):
     for i in keys:
         x[i] = original_x[i]
 
+
+def _first_defining(type_instance: type, name: str) -> type | None:
+    for i in type.__getattribute__(type_instance, "__mro__")[1:]:
+        if name in type.__getattribute__(i, "__dict__"):
+            return i
+    return None
+
+
 class PrivateAttrType(type):
     _type_attr_dict = {}
     _type_allowed_code = {}
-    _type_need_call = {}
+    _type_name_map = {}
+    _type_private_names = {}
+    _type_mro_private_names = {}
     _type_lock = {}
 
     @classmethod
-    def _hash_private_attribute(cls, name: str) -> tuple[str]:
-        return (hashlib.sha256(f"_{_running_time}_{name}".encode("utf-8")).hexdigest(),
-                hashlib.sha256(f"{id(cls)}_{name}".encode("utf-8")).hexdigest())
+    def _hash_private_attribute(cls, name: str) -> tuple[str, str]:
+        digest = hashlib.sha256(f"_{_running_time}_".encode("utf-8") + name.encode("utf-8") + b"\xff%d" % id(cls),
+                                usedforsecurity=False).hexdigest()
+        return (digest[:32], digest[32:])
 
     def __new__(cls, name: str, bases: tuple[type], attrs: dict[str, Any],
                 private_func: Callable[[int, str], str] | None=None):
@@ -180,34 +194,18 @@ class PrivateAttrType(type):
         if not isinstance(private_attr_list,
                           collections.abc.Sequence) or isinstance(private_attr_list, (str, bytes)):
             raise TypeError("'__private_attrs__' must be a sequence of the string")
-        history_private_attrs = []
+        history_private_names = set()
         for i in bases:
             if isinstance(i, cls):
-                history_private_attrs += list(i.__private_attrs__)
+                history_private_names |= cls._type_mro_private_names[id(i)]
 
-        history_private_attrs = tuple(set(history_private_attrs))
-        hash_private_list = []
+        changed_attr_list = list(dict.fromkeys(change_name(i) for i in private_attr_list))
+        hash_private_list = tuple(sorted(cls._hash_private_attribute(i) for i in changed_attr_list))
+        own_private_names = frozenset(changed_attr_list)
+        history_private_names = frozenset(history_private_names)
+        private_name_set = own_private_names | history_private_names
         for i in private_attr_list:
-            hash_private_list.append(cls._hash_private_attribute(change_name(i)))
-
-        hash_private_list = tuple(sorted(hash_private_list))
-        invalid_names = [
-            "__private_attrs__",
-            "__name__",
-            "__module__",
-            "__class__",
-            "__dict__",
-            "__slots__",
-            "__weakref__",
-            "__getattribute__",
-            "__getattr__",
-            "__setattr__",
-            "__delattr__",
-            "__del__",
-            "__mro__"
-        ]
-        for i in invalid_names:
-            if i in private_attr_list:
+            if i in _INVALID_PRIVATE_ATTR_NAMES:
                 raise TypeError(f"'__private_attrs__' cannot contain the invalid attribute name '{i}'")
         need_update = []
         all_allowed_attrs = list(attrs.values())
@@ -241,6 +239,7 @@ class PrivateAttrType(type):
         if _CONTROL_FOR_CHECK and isinstance(original_del, _PrivateWrap):
             original_del = original_del.result
         obj_attr_dict = {}
+        clear_obj = _clear_obj
         type_attr_dict = cls._type_attr_dict
         type_allowed_code = cls._type_allowed_code
         if callable(private_func):
@@ -259,68 +258,67 @@ class PrivateAttrType(type):
         def is_class_frame(frame: FrameType):
             if frame is None:
                 return False
-            code_list = list(type_allowed_code[id(type_instance)])
-            for i in type_instance.__mro__[1:]:
-                if isinstance(i, cls):
-                    code_list += list(type_allowed_code[id(i)])
-            code_list += [
-                __getattribute__.__code__,
-                __getattr__.__code__,
-                __setattr__.__code__,
-                __delattr__.__code__,
-                __del__.__code__,
-            ]
-            return frame.f_code in code_list
+            code = frame.f_code
+            if code in allowed_code_union:
+                return True
+            for i in private_mro:
+                if code in type_allowed_code[id(i)]:
+                    allowed_code_union.add(code)
+                    return True
+            return False
 
         def __getattribute__(self, attr):
-            if cls._hash_private_attribute(attr) in hash_private_list or \
-                cls._hash_private_attribute(attr) in history_private_attrs:
+            if attr in private_name_set:
                 raise AttributeError(f"'{type_instance.__name__}' object has no attribute '{attr}'",
                                      name=attr,
                                      obj=self)
             if original_getattribute:
                 result = original_getattribute(self, attr)
                 if hasattr(result, "__code__"):
-                    if result.__code__ not in type_allowed_code[id(type_instance)]:
-                        type_allowed_code[id(type_instance)] += (result.__code__,)
+                    own_allowed_code.add(result.__code__)
+                    allowed_code_union.add(result.__code__)
+                return result
+            if getattribute_base is not None:
+                result = getattribute_base.__getattribute__(self, attr)
+                if hasattr(result, "__code__"):
+                    own_allowed_code.add(result.__code__)
+                    allowed_code_union.add(result.__code__)
                 return result
-            for all_subtype in type_instance.__mro__[1:]:
-                if hasattr(all_subtype, "__getattribute__"):
-                    result = all_subtype.__getattribute__(self, attr)
-                    if hasattr(result, "__code__"):
-                        if result.__code__ not in type_allowed_code[id(type_instance)]:
-                            type_allowed_code[id(type_instance)] += (result.__code__,)
-                    return result
             raise AttributeError(f"'{type_instance.__name__}' object has no attribute '{attr}'",
                                  name=attr,
                                  obj=self)
 
         def __getattr__(self, attr):
-            frame = inspect.currentframe()
-            frame = frame.f_back
+            if attr not in private_name_set:
+                if original_getattr:
+                    result = original_getattr(self, attr)
+                    return result
+                if getattr_base is not None:
+                    result = getattr_base.__getattr__(self, attr)
+                    return result
+                raise AttributeError(f"'{type_instance.__name__}' object has no attribute '{attr}'",
+                                    name=attr,
+                                    obj=self)
+            frame = sys._getframe(1)
             try:
-                if cls._hash_private_attribute(attr) in hash_private_list:
-                    if id(self) not in obj_attr_dict:
-                        obj_attr_dict[id(self)] = {}
+                if attr in own_private_names:
+                    self_attr_dict = obj_attr_dict.setdefault(id(self), {})
                     if not is_class_frame(frame):
                         raise AttributeError(f"'{type_instance.__name__}' object has no attribute '{attr}'",
                                             name=attr,
                                             obj=self)
                     try:
                         private_attr_name = need_call(id(self), attr)
-                        return obj_attr_dict[id(self)][private_attr_name]
+                        return self_attr_dict[private_attr_name]
                     except KeyError:
-                        private_attr_name = need_call(id(type_instance), attr)
+                        private_attr_name = name_map[attr]
                         try:
                             with type_lock:
-                                return obj_attr_dict[id(self)][private_attr_name]
+                                return self_attr_dict[private_attr_name]
                         except KeyError:
                             try:
                                 with type_lock:
-                                    if id(type_instance) in cls._type_attr_dict:
-                                        attribute = cls._type_attr_dict[id(type_instance)][private_attr_name]
-                                    else:
-                                        raise KeyError(id(type_instance))
+                                    attribute = own_attr_dict[private_attr_name]
                             except KeyError:
                                 raise AttributeError(f"'{type_instance.__name__}' object has no attribute '{attr}'",
                                                     name=attr,
@@ -331,28 +329,17 @@ class PrivateAttrType(type):
                                     return result
                                 else:
                                     return attribute
-                elif cls._hash_private_attribute(attr) in history_private_attrs:
-                    if not is_class_frame(frame):
-                        raise AttributeError(f"'{type_instance.__name__}' object has no attribute '{attr}'",
-                                            name=attr,
-                                            obj=self)
-                    for all_subtype in type_instance.__mro__[1:]:
-                        if hasattr(all_subtype, "__getattr__") and isinstance(all_subtype, PrivateAttrType):
-                            try:
-                                result = all_subtype.__getattr__(self, attr)
-                                return result
-                            except AttributeError:
-                                continue
+                if not is_class_frame(frame):
                     raise AttributeError(f"'{type_instance.__name__}' object has no attribute '{attr}'",
                                         name=attr,
                                         obj=self)
-                if original_getattr:
-                    result = original_getattr(self, attr)
-                    return result
-                for all_subtype in type_instance.__mro__[1:]:
-                    if hasattr(all_subtype, "__getattr__"):
-                        result = all_subtype.__getattr__(self, attr)
-                        return result
+                for all_subtype in private_mro:
+                    if "__getattr__" in type.__getattribute__(all_subtype, "__dict__"):
+                        try:
+                            result = all_subtype.__getattr__(self, attr)
+                            return result
+                        except AttributeError:
+                            continue
                 raise AttributeError(f"'{type_instance.__name__}' object has no attribute '{attr}'",
                                     name=attr,
                                     obj=self)
@@ -360,106 +347,90 @@ class PrivateAttrType(type):
                 del frame
 
         def __setattr__(self, attr, value):
-            frame = inspect.currentframe()
-            frame = frame.f_back
+            if attr not in private_name_set:
+                if original_setattr:
+                    original_setattr(self, attr, value)
+                elif setattr_base is not None:
+                    setattr_base.__setattr__(self, attr, value)
+                return
+            frame = sys._getframe(1)
             try:
-                if cls._hash_private_attribute(attr) in hash_private_list:
-                    if id(self) not in obj_attr_dict:
-                        obj_attr_dict[id(self)] = {}
+                if attr in own_private_names:
+                    self_attr_dict = obj_attr_dict.setdefault(id(self), {})
                     if not is_class_frame(frame):
                         raise AttributeError(f"cannot set private attribute '{attr}' to '{type_instance.__name__}' object",
                                             name=attr,
                                             obj=self)
                     with type_lock:
-                        if id(type_instance) in cls._type_attr_dict:
-                            private_attr_name = need_call(id(type_instance), attr)
-                            attribute = cls._type_attr_dict[id(type_instance)].get(private_attr_name, None)
-                            if hasattr(attribute, "__set__"):
-                                attribute.__set__(self, value)
-                                return
+                        private_attr_name = name_map[attr]
+                        attribute = own_attr_dict.get(private_attr_name, None)
+                        if hasattr(attribute, "__set__"):
+                            attribute.__set__(self, value)
+                            return
                         private_attr_name = need_call(id(self), attr)
-                        obj_attr_dict[id(self)][private_attr_name] = value
-                        _resortkey(obj_attr_dict[id(self)])
-                elif cls._hash_private_attribute(attr) in history_private_attrs:
+                        self_attr_dict[private_attr_name] = value
+                        _resortkey(self_attr_dict)
+                else:
                     if not is_class_frame(frame):
                         raise AttributeError(f"cannot set private attribute '{attr}' to '{type_instance.__name__}' object",
                                             name=attr,
                                             obj=self)
-                    for all_subtype in type_instance.__mro__[1:]:
-                        if hasattr(all_subtype, "__setattr__") and isinstance(all_subtype, PrivateAttrType):
-                            all_subtype.__setattr__(self, attr, value)
-                            break
-                elif original_setattr:
-                    original_setattr(self, attr, value)
-                else:
-                    for all_subtype in type_instance.__mro__[1:]:
-                        if hasattr(all_subtype, "__setattr__"):
-                            all_subtype.__setattr__(self, attr, value)
-                            break
+                    private_mro[0].__setattr__(self, attr, value)
             finally:
                 del frame
 
         def __delattr__(self, attr):
-            frame = inspect.currentframe()
-            frame = frame.f_back
+            if attr not in private_name_set:
+                if original_delattr:
+                    original_delattr(self, attr)
+                elif delattr_base is not None:
+                    delattr_base.__delattr__(self, attr)
+                return
+            frame = sys._getframe(1)
             try:
-                if cls._hash_private_attribute(attr) in hash_private_list:
-                    if id(self) not in obj_attr_dict:
-                        obj_attr_dict[id(self)] = {}
+                if attr in own_private_names:
+                    self_attr_dict = obj_attr_dict.setdefault(id(self), {})
                     if not is_class_frame(frame):
                         raise AttributeError(
                             f"cannot delete private attribute '{attr}' on '{type_instance.__name__}' object",
                             name=attr,
                             obj=self)
                     with type_lock:
-                        if id(type_instance) in cls._type_attr_dict:
-                            private_attr_name = need_call(id(type_instance), attr)
-                            attribute = cls._type_attr_dict[id(type_instance)].get(private_attr_name, None)
-                            if hasattr(attribute, "__delete__"):
-                                attribute.__delete__(self)
-                                return
+                        private_attr_name = name_map[attr]
+                        attribute = own_attr_dict.get(private_attr_name, None)
+                        if hasattr(attribute, "__delete__"):
+                            attribute.__delete__(self)
+                            return
                         private_attr_name = need_call(id(self), attr)
                         try:
-                            del obj_attr_dict[id(self)][private_attr_name]
+                            del self_attr_dict[private_attr_name]
                         except KeyError:
                             raise AttributeError(f"'{type_instance.__name__}' object has no attribute '{attr}'",
                                                 name=attr,
                                                 obj=self) from None
-                elif cls._hash_private_attribute(attr) in history_private_attrs:
+                else:
                     if not is_class_frame(frame):
                         raise AttributeError(
                             f"cannot delete private attribute '{attr}' on '{type_instance.__name__}' object",
                             name=attr,
                             obj=self)
-                    for all_subtype in type_instance.__mro__[1:]:
-                        if hasattr(all_subtype, "__delattr__") and isinstance(all_subtype, PrivateAttrType):
+                    for all_subtype in private_mro:
+                        if hasattr(all_subtype, "__delattr__"):
                             try:
                                 all_subtype.__delattr__(self, attr)
                                 break
                             except AttributeError:
                                 pass
-                elif original_delattr:
-                    original_delattr(self, attr)
-                else:
-                    for all_subtype in type_instance.__mro__[1:]:
-                        if hasattr(all_subtype, "__delattr__"):
-                            all_subtype.__delattr__(self, attr)
-                            break
             finally:
                 del frame
 
         def __del__(self):
-            if _clear_obj:
-                _clear_obj(id(self))
-            if id(self) in obj_attr_dict:
-                del obj_attr_dict[id(self)]
+            clear_obj(id(self))
+            obj_attr_dict.pop(id(self), None)
             if original_del:
                 original_del(self)
-            else:
-                for all_subtype in type.__getattribute__(type_instance, "__mro__")[1:]:
-                    if hasattr(all_subtype, "__del__"):
-                        all_subtype.__del__(self)
-                        break
+            elif del_base is not None:
+                del_base.__del__(self)
 
         def __getstate__(self):
             raise TypeError(f"Cannot pickle '{type_instance.__name__}' objects")
@@ -473,9 +444,10 @@ class PrivateAttrType(type):
         if "__setstate__" not in attrs:
             attrs["__setstate__"] = __setstate__
         attrs['__getattribute__'] = __getattribute__
-        attrs['__getattr__'] = __getattr__
-        attrs['__setattr__'] = __setattr__
-        attrs['__delattr__'] = __delattr__
+        if private_name_set:
+            attrs['__getattr__'] = __getattr__
+            attrs['__setattr__'] = __setattr__
+            attrs['__delattr__'] = __delattr__
         attrs["__del__"] = __del__
         attrs["__private_attrs__"] = tuple(hash_private_list)
         all_items = attrs.items()
@@ -483,22 +455,38 @@ class PrivateAttrType(type):
             if _CONTROL_FOR_CHECK and isinstance(v, _PrivateWrap):
                 attrs[k] = v.result
         type_instance = super().__new__(cls, name, bases, attrs)
-        type_attr_dict[id(type_instance)] = {need_call(id(type_instance), "__private_attrs__"): tuple(
-            (hashlib.sha256(change_name(i).encode("utf-8")).hexdigest(), 
-             hashlib.sha256(f"{id(type_instance)}_{change_name(i)}".encode("utf-8")).hexdigest())
-            for i in private_attr_list
-        )}
-        type_allowed_code[id(type_instance)] = tuple(all_code)
-        cls._type_need_call[id(type_instance)] = need_call
+        name_map = {i: need_call(id(type_instance), i) for i in changed_attr_list}
+        own_attr_dict = type_attr_dict[id(type_instance)] = {}
+        own_allowed_code = type_allowed_code[id(type_instance)] = set(all_code)
+        private_mro = tuple(i for i in type_instance.__mro__[1:] if isinstance(i, cls))
+        getattribute_base = _first_defining(type_instance, "__getattribute__")
+        getattr_base = _first_defining(type_instance, "__getattr__")
+        setattr_base = _first_defining(type_instance, "__setattr__")
+        delattr_base = _first_defining(type_instance, "__delattr__")
+        del_base = _first_defining(type_instance, "__del__")
+        allowed_code_union = set(all_code)
+        for i in private_mro:
+            allowed_code_union |= type_allowed_code[id(i)]
+        allowed_code_union |= {
+            __getattribute__.__code__,
+            __getattr__.__code__,
+            __setattr__.__code__,
+            __delattr__.__code__,
+            __del__.__code__,
+        }
+        cls._type_name_map[id(type_instance)] = name_map
+        cls._type_private_names[id(type_instance)] = own_private_names
+        cls._type_mro_private_names[id(type_instance)] = own_private_names.union(
+            *(cls._type_private_names[id(i)] for i in private_mro))
         for i in need_update:
-            new_attr = need_call(id(type_instance), i[0])
+            new_attr = name_map[i[0]]
             value_i = i[1]
             if _CONTROL_FOR_CHECK and isinstance(value_i, _PrivateWrap):
                 value_i = value_i.result
-            type_attr_dict[id(type_instance)][new_attr] = value_i
+            own_attr_dict[new_attr] = value_i
             if hasattr(value_i, "__set_name__"):
                 value_i.__set_name__(type_instance, new_attr)
-        _resortkey(type_attr_dict[id(type_instance)])
+        _resortkey(own_attr_dict)
         type_lock = threading.Lock()
         cls._type_lock[id(type_instance)] = type_lock
         return type_instance
@@ -507,55 +495,29 @@ class PrivateAttrType(type):
     def _is_class_code(cls, frame: FrameType):
         if frame is None:
             return False
-        all_possible_local = []
-        code_list = PrivateAttrType._type_allowed_code.get(id(cls), ())
-        for i in code_list:
-            if not hasattr(i, "co_qualname"):
-                continue
-            if frame.f_code.co_qualname.startswith(i.co_qualname):
-                all_possible_local.append(i)
-        code_list += tuple(
-            getattr(PrivateAttrType, i).__code__ for i in 
-            ("__getattribute__", "__getattr__", "__setattr__", "__delattr__", "__del__")
-        )
-        return frame.f_code in code_list
+        if frame.f_code in _TYPE_ALLOWED_CODE.get(id(cls), ()):
+            return True
+        return frame.f_code in _TYPE_DUNDER_CODE
 
     def __getattribute__(cls, attr):
-        try:
-            if (hashlib.sha256(attr.encode("utf-8")).hexdigest(),
-                hashlib.sha256(f"{id(cls)}_{attr}".encode("utf-8")).hexdigest()) in \
-                    PrivateAttrType._type_attr_dict[id(cls)][
-                        PrivateAttrType._type_need_call[id(cls)](id(cls), "__private_attrs__")]:
-                raise AttributeError()
-            for icls in type.__getattribute__(cls, "__mro__")[1:]:
-                if id(icls) in PrivateAttrType._type_attr_dict:
-                    if (hashlib.sha256(attr.encode("utf-8")).hexdigest(),
-                        hashlib.sha256(f"{id(icls)}_{attr}".encode("utf-8")).hexdigest()) in \
-                            PrivateAttrType._type_attr_dict[id(icls)][
-                                PrivateAttrType._type_need_call[id(icls)](id(icls), "__private_attrs__")]:
-                        raise AttributeError()
-        except KeyError:
-            pass
+        if attr in _TYPE_MRO_PRIVATE_NAMES.get(id(cls), ()):
+            raise AttributeError()
         result = super().__getattribute__(attr)
         return result
 
     def __getattr__(cls, attr):
-        frame = inspect.currentframe()
-        frame = frame.f_back
-        type_lock = PrivateAttrType._type_lock[id(cls)]
+        frame = sys._getframe(1)
+        type_lock = _TYPE_LOCK[id(cls)]
         try:
-            if (hashlib.sha256(attr.encode("utf-8")).hexdigest(),
-                hashlib.sha256(f"{id(cls)}_{attr}".encode("utf-8")).hexdigest()) in \
-                    PrivateAttrType._type_attr_dict[id(cls)][
-                        PrivateAttrType._type_need_call[id(cls)](id(cls), "__private_attrs__")]:
+            if attr in _TYPE_PRIVATE_NAMES[id(cls)]:
                 if not PrivateAttrType._is_class_code(cls, frame):
                     raise AttributeError(f"'{cls.__name__}' class has no attribute '{attr}'",
                                             name=attr,
                                             obj=cls)
-                private_attr_name = PrivateAttrType._type_need_call[id(cls)](id(cls), attr)
+                private_attr_name = _TYPE_NAME_MAP[id(cls)][attr]
                 try:
                     with type_lock:
-                        result = PrivateAttrType._type_attr_dict[id(cls)][private_attr_name]
+                        result = _TYPE_ATTR_DICT[id(cls)][private_attr_name]
                 except KeyError:
                     raise AttributeError(f"'{cls.__name__}' class has no attribute '{attr}'",
                                         name=attr,
@@ -568,11 +530,8 @@ class PrivateAttrType(type):
                         return result
             else:
                 for icls in cls.__mro__[1:]:
-                    if id(icls) in PrivateAttrType._type_attr_dict:
-                        if (hashlib.sha256(attr.encode("utf-8")).hexdigest(),
-                            hashlib.sha256(f"{id(icls)}_{attr}".encode("utf-8")).hexdigest()) in \
-                                PrivateAttrType._type_attr_dict[id(icls)][
-                                    PrivateAttrType._type_need_call[id(icls)](id(icls), "__private_attrs__")]:
+                    if id(icls) in _TYPE_ATTR_DICT:
+                        if attr in _TYPE_PRIVATE_NAMES[id(icls)]:
                             try:
                                 result = PrivateAttrType.__getattr__(icls, attr)
                                 return result
@@ -585,42 +544,24 @@ class PrivateAttrType(type):
             del frame
 
     def __setattr__(cls, attr, value):
-        invalid_names = [
-            "__class__",
-            "__delattr__",
-            "__getattribute__",
-            "__getattr__",
-            "__setattr__",
-            "__getstate__",
-            "__setstate__",
-            "__del__",
-            "__private_attrs__"
-        ]
-        if attr in invalid_names:
+        if attr in _INVALID_CLASS_ATTR_NAMES:
             raise AttributeError(f"cannot set '{attr}' attribute on class '{cls.__name__}'")
-        frame = inspect.currentframe()
-        frame = frame.f_back
-        type_lock = PrivateAttrType._type_lock[id(cls)]
+        frame = sys._getframe(1)
+        type_lock = _TYPE_LOCK[id(cls)]
         try:
-            if (hashlib.sha256(attr.encode("utf-8")).hexdigest(),
-                hashlib.sha256(f"{id(cls)}_{attr}".encode("utf-8")).hexdigest()) in \
-                    PrivateAttrType._type_attr_dict[id(cls)][
-                        PrivateAttrType._type_need_call[id(cls)](id(cls), "__private_attrs__")]:
+            if attr in _TYPE_PRIVATE_NAMES[id(cls)]:
                 if not PrivateAttrType._is_class_code(cls, frame):
                     raise AttributeError(f"cannot set private attribute '{attr}' to class '{cls.__name__}'",
                                         name=attr,
                                         obj=cls)
                 with type_lock:
-                    private_attr_name = PrivateAttrType._type_need_call[id(cls)](id(cls), attr)
-                    PrivateAttrType._type_attr_dict[id(cls)][private_attr_name] = value
-                    _resortkey(PrivateAttrType._type_attr_dict[id(cls)])
+                    private_attr_name = _TYPE_NAME_MAP[id(cls)][attr]
+                    _TYPE_ATTR_DICT[id(cls)][private_attr_name] = value
+                    _resortkey(_TYPE_ATTR_DICT[id(cls)])
             else:
                 for icls in cls.__mro__[1:]:
-                    if id(icls) in PrivateAttrType._type_attr_dict:
-                        if (hashlib.sha256(attr.encode("utf-8")).hexdigest(),
-                            hashlib.sha256(f"{id(icls)}_{attr}".encode("utf-8")).hexdigest()) in \
-                                PrivateAttrType._type_attr_dict[id(icls)][PrivateAttrType._type_need_call[
-                                    id(icls)](id(icls), "__private_attrs__")]:
+                    if id(icls) in _TYPE_ATTR_DICT:
+                        if attr in _TYPE_PRIVATE_NAMES[id(icls)]:
                             PrivateAttrType.__setattr__(icls, attr, value)
                             return
                 else:
@@ -629,46 +570,28 @@ class PrivateAttrType(type):
             del frame
 
     def __delattr__(cls, attr):
-        invalid_names = [
-            "__class__",
-            "__delattr__",
-            "__getattribute__",
-            "__getattr__",
-            "__setattr__",
-            "__getstate__",
-            "__setstate__",
-            "__del__",
-            "__private_attrs__"
-        ]
-        if attr in invalid_names:
+        if attr in _INVALID_CLASS_ATTR_NAMES:
             raise AttributeError(f"cannot delete '{attr}' attribute on class '{cls.__name__}'")
-        frame = inspect.currentframe()
-        frame = frame.f_back
-        type_lock = PrivateAttrType._type_lock[id(cls)]
+        frame = sys._getframe(1)
+        type_lock = _TYPE_LOCK[id(cls)]
         try:
-            if (hashlib.sha256(attr.encode("utf-8")).hexdigest(),
-                hashlib.sha256(f"{id(cls)}_{attr}".encode("utf-8")).hexdigest()) in \
-                    PrivateAttrType._type_attr_dict[id(cls)][PrivateAttrType._type_need_call[
-                        id(cls)](id(cls), "__private_attrs__")]:
+            if attr in _TYPE_PRIVATE_NAMES[id(cls)]:
                 if not PrivateAttrType._is_class_code(cls, frame):
                     raise AttributeError(f"cannot delete private attribute '{attr}' on class '{cls.__name__}'",
                                         name=attr,
                                         obj=cls)
-                private_attr_name = PrivateAttrType._type_need_call[id(cls)](id(cls), attr)
+                private_attr_name = _TYPE_NAME_MAP[id(cls)][attr]
                 try:
                     with type_lock:
-                        del PrivateAttrType._type_attr_dict[id(cls)][private_attr_name]
+                        del _TYPE_ATTR_DICT[id(cls)][private_attr_name]
                 except KeyError:
                     raise AttributeError(f"'{cls.__name__}' class has no attribute '{attr}'",
                                         name=attr,
                                         obj=cls) from None
             else:
                 for icls in cls.__mro__[1:]:
-                    if id(icls) in PrivateAttrType._type_attr_dict:
-                        if (hashlib.sha256(attr.encode("utf-8")).hexdigest(),
-                            hashlib.sha256(f"{id(icls)}_{attr}".encode("utf-8")).hexdigest()) in \
-                                PrivateAttrType._type_attr_dict[id(icls)][
-                                    PrivateAttrType._type_need_call[id(icls)](id(icls), "__private_attrs__")]:
+                    if id(icls) in _TYPE_ATTR_DICT:
+                        if attr in _TYPE_PRIVATE_NAMES[id(icls)]:
                             PrivateAttrType.__delattr__(icls, attr)
                             return
                 else:
@@ -683,8 +606,14 @@ class PrivateAttrType(type):
             del PrivateAttrType._type_attr_dict[id(cls)]
         if id(cls) in PrivateAttrType._type_allowed_code:
             del PrivateAttrType._type_allowed_code[id(cls)]
-        if id(cls) in PrivateAttrType._type_need_call:
-            del PrivateAttrType._type_need_call[id(cls)]
+        if id(cls) in PrivateAttrType._type_name_map:
+            del PrivateAttrType._type_name_map[id(cls)]
+        if id(cls) in PrivateAttrType._type_lock:
+            del PrivateAttrType._type_lock[id(cls)]
+        if id(cls) in PrivateAttrType._type_private_names:
+            del PrivateAttrType._type_private_names[id(cls)]
+        if id(cls) in PrivateAttrType._type_mro_private_names:
+            del PrivateAttrType._type_mro_private_names[id(cls)]
 
     def __getstate__(cls):
         raise TypeError("Cannot pickle PrivateAttrType classes")
@@ -693,6 +622,17 @@ class PrivateAttrType(type):
         raise TypeError("Cannot unpickle PrivateAttrType classes")
 
 
+_TYPE_ALLOWED_CODE = PrivateAttrType._type_allowed_code
+_TYPE_ATTR_DICT = PrivateAttrType._type_attr_dict
+_TYPE_LOCK = PrivateAttrType._type_lock
+_TYPE_MRO_PRIVATE_NAMES = PrivateAttrType._type_mro_private_names
+_TYPE_NAME_MAP = PrivateAttrType._type_name_map
+_TYPE_PRIVATE_NAMES = PrivateAttrType._type_private_names
+_TYPE_DUNDER_CODE = frozenset(
+    getattr(PrivateAttrType, i).__code__ for i in
+    ("__getattribute__", "__getattr__", "__setattr__", "__delattr__", "__del__")
+)
+
 _CONTROL_FOR_CHECK = False
 
 
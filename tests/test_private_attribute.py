@@ -0,0 +1,152 @@
+import unittest
+
+from private_attribute import PrivateAttrBase
+
+
+class Base(PrivateAttrBase):
+    __private_attrs__ = ("x",)
+
+    def __init__(self):
+        self.x = 1
+
+    def get_x(self):
+        return self.x
+
+
+class Middle(Base):
+    __private_attrs__ = ("y",)
+
+
+class Leaf(Middle):
+    __private_attrs__ = ()
+
+    def leaf_get_x(self):
+        return self.x
+
+    def leaf_set_x(self, value):
+        self.x = value
+
+
+class Child(Base):
+    __private_attrs__ = ("z",)
+
+    def __init__(self):
+        super().__init__()
+        self.z = 2
+
+    def child_get_x(self):
+        return self.x
+
+    def child_set_x(self, value):
+        self.x = value
+
+    def child_del_x(self):
+        del self.x
+
+
+class Owner(PrivateAttrBase):
+    __private_attrs__ = ("secret",)
+
+    def __init__(self):
+        self.secret = "s"
+
+    def get_secret(self):
+        return self.secret
+
+    def set_secret(self, value):
+        self.secret = value
+
+    def del_secret(self):
+        del self.secret
+
+
+class TestPublicAttributes(unittest.TestCase):
+    def test_get_set_del(self):
+        obj = Owner()
+        obj.public = 1
+        self.assertEqual(obj.public, 1)
+        obj.public = 2
+        self.assertEqual(obj.public, 2)
+        del obj.public
+        with self.assertRaises(AttributeError):
+            obj.public
+
+    def test_missing_attribute(self):
+        with self.assertRaises(AttributeError):
+            Owner().missing
+
+
+class TestOwnPrivateAttributes(unittest.TestCase):
+    def test_inside_access(self):
+        obj = Owner()
+        self.assertEqual(obj.get_secret(), "s")
+        obj.set_secret("t")
+        self.assertEqual(obj.get_secret(), "t")
+        obj.del_secret()
+        with self.assertRaises(AttributeError):
+            obj.get_secret()
+
+    def test_outside_access(self):
+        obj = Owner()
+        with self.assertRaises(AttributeError):
+            obj.secret
+        with self.assertRaises(AttributeError):
+            obj.secret = "t"
+        with self.assertRaises(AttributeError):
+            del obj.secret
+        self.assertEqual(obj.get_secret(), "s")
+
+
+class TestTwoLevelInheritance(unittest.TestCase):
+    def test_child_methods_use_parent_private(self):
+        obj = Child()
+        self.assertEqual(obj.child_get_x(), 1)
+        obj.child_set_x(3)
+        self.assertEqual(obj.child_get_x(), 3)
+        self.assertEqual(obj.get_x(), 3)
+        obj.child_del_x()
+        with self.assertRaises(AttributeError):
+            obj.child_get_x()
+
+    def test_outside_cannot_use_parent_private(self):
+        obj = Child()
+        with self.assertRaises(AttributeError):
+            obj.x
+        with self.assertRaises(AttributeError):
+            obj.x = 3
+        with self.assertRaises(AttributeError):
+            del obj.x
+        with self.assertRaises(AttributeError):
+            obj.z
+        self.assertEqual(obj.get_x(), 1)
+
+
+class TestThreeLevelInheritance(unittest.TestCase):
+    def test_outside_cannot_read_grandparent_private(self):
+        obj = Leaf()
+        with self.assertRaises(AttributeError):
+            obj.x
+        self.assertFalse(hasattr(obj, "x"))
+
+    def test_outside_cannot_write_grandparent_private(self):
+        obj = Leaf()
+        with self.assertRaises(AttributeError):
+            setattr(obj, "x", 99)
+        self.assertEqual(obj.get_x(), 1)
+
+    def test_outside_cannot_delete_grandparent_private(self):
+        obj = Leaf()
+        with self.assertRaises(AttributeError):
+            delattr(obj, "x")
+        self.assertEqual(obj.get_x(), 1)
+
+    def test_class_methods_can_use_grandparent_private(self):
+        obj = Leaf()
+        self.assertEqual(obj.leaf_get_x(), 1)
+        obj.leaf_set_x(5)
+        self.assertEqual(obj.leaf_get_x(), 5)
+        self.assertEqual(obj.get_x(), 5)
+
+
+if __name__ == "__main__":
+    unittest.main()